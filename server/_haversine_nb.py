@@ -0,0 +1,44 @@
+"""Numba-compiled haversine kernels.
+
+Importing this module requires numba; callers treat ImportError as "no JIT
+available" and fall back to their NumPy paths.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# IUGG mean Earth radius
+EARTH_RADIUS_KM = 6371.0088
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def max_pairwise_km(lat_rad, lon_rad):
+    """Max pairwise haversine distance (km) over pre-radians coordinates.
+
+    Fuses the trig and the max reduction into one parallel loop, so no
+    O(n^2) intermediate arrays are allocated. Callers must filter NaNs
+    first: fastmath assumes none.
+    """
+    n = lat_rad.size
+    max_distance = 0.0
+    for i in prange(n):
+        local_max = 0.0
+        for j in range(i + 1, n):
+            dlat = lat_rad[i] - lat_rad[j]
+            dlon = lon_rad[i] - lon_rad[j]
+            a = (
+                np.sin(dlat * 0.5) ** 2
+                + np.cos(lat_rad[i]) * np.cos(lat_rad[j]) * np.sin(dlon * 0.5) ** 2
+            )
+            d = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+            local_max = max(local_max, d)
+        # max() is one of the reductions numba recognizes across prange
+        max_distance = max(max_distance, local_max)
+    return max_distance
+
+
+def warm():
+    """Compile the kernel for both coordinate precisions up front."""
+    for dtype in (np.float64, np.float32):
+        pts = np.radians(np.array([40.0, 41.0], dtype=dtype))
+        max_pairwise_km(pts, pts)
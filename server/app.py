@@ -1,49 +1,172 @@
-from flask import Flask, request, jsonify, send_file
-from flask_cors import CORS
+from quart import Quart, request, jsonify
+from quart_cors import cors
 from data_processor import DataProcessor
 from tower_jump_detector import TowerJumpDetector
-import io
+import shared_store
+import aiofiles
+import asyncio
+import fcntl
+import os
+import tempfile
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import uuid
-import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+app = Quart(__name__)
+app = cors(app, allow_origin="*")
+
+# Uploaded data and analysis results live in shared_store (Arrow IPC in
+# shared memory) so all server workers see the same state without each
+# holding a private copy. Ideally this should be a database or persistent
+# storage.
+
+# Job tracking for asynchronous analysis. The table lives in shared_store so
+# a status poll landing on any worker sees jobs created by the others; a file
+# lock serializes the read-modify-write updates across workers. Bounded:
+# oldest entries are evicted past _MAX_JOBS and a background reaper drops
+# entries older than the TTL, so the table cannot grow without limit.
+# Ideally this would be a real job queue (e.g. Celery + RabbitMQ).
+_JOBS_KEY = "analysis_jobs"
+_JOBS_LOCK_PATH = os.path.join(tempfile.gettempdir(), "towerjumps-jobs.lock")
+_MAX_JOBS = 32
+_JOB_TTL_SECONDS = 3600
+_JOB_REAP_INTERVAL_SECONDS = 60
+
+# Serialized CSV bytes for the current analysis_results, so repeated export
+# clicks don't re-encode the whole DataFrame. The entry pins the DataFrame
+# and is checked with `is`, so a recycled id can never serve a stale export.
+# Result sets bigger than the cap are streamed without being cached.
+_export_cache = None  # (analysis_results, csv bytes)
+_EXPORT_CHUNK_BYTES = 1 << 20
+_EXPORT_CACHE_MAX_BYTES = 64 << 20
+
+# Sorted row orders per (result set, sort column, direction). The table UI
+# re-requests the same ordering page after page; the argsort runs once and
+# every subsequent page is an O(page) slice. Entries pin the DataFrame so
+# ids cannot be recycled while cached.
+_sort_index_cache = OrderedDict()  # (id, sort_by, ascending) -> (df, order)
+_SORT_CACHE_MAX_ENTRIES = 16
+
+
+def _sorted_order(df, sort_by, ascending):
+    """Row positions of `df` ordered by `sort_by`, cached per result set."""
+    key = (id(df), sort_by, ascending)
+    hit = _sort_index_cache.get(key)
+    if hit is not None and hit[0] is df:
+        return hit[1]
+
+    order = np.argsort(df[sort_by].to_numpy(), kind="stable")
+    if not ascending:
+        order = order[::-1]
+
+    _sort_index_cache[key] = (df, order)
+    while len(_sort_index_cache) > _SORT_CACHE_MAX_ENTRIES:
+        _sort_index_cache.popitem(last=False)
+    return order
+
+
+# The analysis is CPU-bound pandas/numpy work; running it on a thread would
+# hold the GIL and serialize concurrent analyses. A process pool gives each
+# job its own interpreter and leaves this process free to serve requests.
+_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+# Jump masks per result set, pinned like the sort-index cache so ids cannot
+# be recycled. Kept out of DataFrame.attrs: an ndarray there makes every
+# Arrow serialization (export, shared_store.put) warn and drop all attrs,
+# including the precomputed summary.
+_jump_mask_cache = OrderedDict()  # id -> (df, mask)
+_JUMP_MASK_CACHE_MAX_ENTRIES = 4
+
+
+def _jump_mask(results):
+    """Boolean array marking tower-jump rows, computed once per result set.
+
+    Counting and filtering on a packed bool array beats re-running the
+    string comparison and building a filtered DataFrame on every request.
+    """
+    hit = _jump_mask_cache.get(id(results))
+    if hit is not None and hit[0] is results:
+        return hit[1]
+
+    mask = results["IsTowerJump"].to_numpy() == "yes"
+    _jump_mask_cache[id(results)] = (results, mask)
+    while len(_jump_mask_cache) > _JUMP_MASK_CACHE_MAX_ENTRIES:
+        _jump_mask_cache.popitem(last=False)
+    return mask
+
+
+def _run_analysis(df):
+    """Run the full analysis; top-level so it pickles into worker processes."""
+    detector = TowerJumpDetector()
+    results = detector.analyze(df)
+    summary = detector.get_summary_stats(results)
+    return results, summary
+
+
+def json_response(payload, status=200):
+    """Serialize a response with orjson.
+
+    orjson is much faster than the stdlib encoder and understands numpy
+    scalars directly. DataFrames are embedded as orjson.Fragment wrapping
+    DataFrame.to_json output, which serializes rows in C without building
+    a Python dict per row.
+    """
+    return app.response_class(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype="application/json",
+    )
 
-app = Flask(__name__)
-CORS(app)
-
-# Global variables to store analysis state
-# Ideally this should be a database or persistent storage
-current_data = None
-analysis_results = None
-
-# Job tracking for asynchronous analysis
-analysis_jobs = {}  # {job_id: {status, progress, results, error, created_at}}
 
-# Ideally we would use a more robust job queue system, like Celery + RabbitMQ
-job_lock = threading.Lock()
+def dataframe_records_fragment(df):
+    """Pre-serialized JSON records for a DataFrame, ready to embed."""
+    return orjson.Fragment(df.to_json(orient="records"))
 
 
 @app.route("/api/health", methods=["GET"])
-def health_check():
+async def health_check():
     return jsonify({"status": "healthy", "message": "Tower Jumps API is running"})
 
 
 @app.route("/api/upload", methods=["POST"])
-def upload_file():
-    global current_data
-
-    if "file" not in request.files:
+async def upload_file():
+    files = await request.files
+    if "file" not in files:
         return jsonify({"error": "No file uploaded"}), 400
 
-    file = request.files["file"]
+    file = files["file"]
     if file.filename == "":
         return jsonify({"error": "No file selected"}), 400
 
     if not file.filename.endswith(".csv"):
         return jsonify({"error": "File must be a CSV"}), 400
 
+    # Spool the upload to disk with async file I/O so a large body never
+    # blocks the event loop, then let the parser read it from the file
+    spool_path = os.path.join(
+        tempfile.gettempdir(), f"towerjumps-upload-{uuid.uuid4().hex}.csv"
+    )
+
     try:
+        async with aiofiles.open(spool_path, "wb") as spool:
+            while True:
+                chunk = file.read(_EXPORT_CHUNK_BYTES)
+                if not chunk:
+                    break
+                await spool.write(chunk)
+
         processor = DataProcessor()
-        current_data = processor.load_csv_from_file(file)
+        # CSV parsing is synchronous CPU work - run it in a worker thread so
+        # the event loop keeps serving other requests during large uploads
+        current_data = await asyncio.to_thread(processor.load_csv_from_file, spool_path)
+        shared_store.put("current_data", current_data)
 
         return jsonify(
             {
@@ -57,53 +180,88 @@ def upload_file():
     except Exception as e:
         return jsonify({"error": f"Failed to process file: {str(e)}"}), 500
 
+    finally:
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
 
-def run_analysis_background(job_id):
-    """Run analysis in background thread"""
-    global current_data, analysis_results
 
-    try:
-        with job_lock:
-            analysis_jobs[job_id]["status"] = "running"
-            analysis_jobs[job_id]["progress"] = "Initializing tower jump detector..."
+@contextmanager
+def _jobs_locked():
+    """Serialize job-table read-modify-write across worker processes.
 
-        detector = TowerJumpDetector()
+    The critical sections contain no awaits, so within a worker the event
+    loop never interleaves two of them; flock covers the cross-process case.
+    """
+    with open(_JOBS_LOCK_PATH, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
 
-        with job_lock:
-            analysis_jobs[job_id]["progress"] = "Creating time periods from data... (may take a while for large files)"
 
-        # Run the analysis
-        results = detector.analyze(current_data)
+def _load_jobs():
+    """The shared job table as an insertion-ordered dict."""
+    raw = shared_store.get_bytes(_JOBS_KEY)
+    if raw is None:
+        return OrderedDict()
+    return OrderedDict(orjson.loads(raw))
 
-        with job_lock:
-            analysis_jobs[job_id]["progress"] = "Generating summary statistics..."
 
-        # Generate summary
-        summary = detector.get_summary_stats(results)
+def _save_jobs(jobs):
+    shared_store.put_bytes(_JOBS_KEY, orjson.dumps(jobs))
 
-        with job_lock:
-            analysis_jobs[job_id]["status"] = "completed"
-            analysis_jobs[job_id]["progress"] = "Analysis completed successfully"
-            analysis_jobs[job_id]["results"] = {
-                "message": "Analysis completed successfully",
-                "total_periods": len(results),
-                "tower_jumps_detected": len(results[results["IsTowerJump"] == "yes"]),
-                "analysis_summary": summary,
-                "results": results.to_dict("records"),
-            }
-            analysis_results = results  # Update global for export endpoint
+
+def _update_job(job_id, **fields):
+    """Update a job entry if it is still tracked (it may have been evicted)."""
+    with _jobs_locked():
+        jobs = _load_jobs()
+        job = jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+            _save_jobs(jobs)
+
+
+async def run_analysis_background(job_id):
+    """Run analysis as a background task on the event loop"""
+    try:
+        _update_job(
+            job_id,
+            status="running",
+            progress="Initializing tower jump detector...",
+        )
+
+        current_data = shared_store.get("current_data")
+
+        _update_job(
+            job_id,
+            progress="Running analysis... (may take a while for large files)",
+        )
+
+        # Run the CPU-bound analysis in a worker process so concurrent jobs
+        # use separate cores instead of contending on the GIL
+        results, summary = await asyncio.get_running_loop().run_in_executor(
+            _executor, _run_analysis, current_data
+        )
+
+        # Publish the results before flipping the job to completed, so a
+        # poll that sees "completed" on any worker can always fetch them;
+        # the job table itself only carries the small summary dict
+        shared_store.put("analysis_results", results)
+        _update_job(
+            job_id,
+            status="completed",
+            progress="Analysis completed successfully",
+            summary=summary,
+        )
 
     except Exception as e:
-        with job_lock:
-            analysis_jobs[job_id]["status"] = "failed"
-            analysis_jobs[job_id]["error"] = str(e)
+        _update_job(job_id, status="failed", error=str(e))
 
 
 @app.route("/api/analyze", methods=["POST"])
-def analyze_data():
-    global current_data
-
-    if current_data is None:
+async def analyze_data():
+    if shared_store.get("current_data") is None:
         return (
             jsonify({"error": "No data uploaded. Please upload a CSV file first."}),
             400,
@@ -112,19 +270,21 @@ def analyze_data():
     # Create a new job
     job_id = str(uuid.uuid4())
 
-    with job_lock:
-        analysis_jobs[job_id] = {
+    with _jobs_locked():
+        jobs = _load_jobs()
+        jobs[job_id] = {
             "status": "pending",
             "progress": "Analysis job created",
-            "results": None,
+            "summary": None,
             "error": None,
             "created_at": time.time(),
         }
+        while len(jobs) > _MAX_JOBS:
+            jobs.popitem(last=False)
+        _save_jobs(jobs)
 
     # Start background analysis
-    thread = threading.Thread(target=run_analysis_background, args=(job_id,))
-    thread.daemon = True
-    thread.start()
+    app.add_background_task(run_analysis_background, job_id)
 
     return jsonify(
         {
@@ -135,33 +295,67 @@ def analyze_data():
     )
 
 
-@app.route("/api/status/<job_id>", methods=["GET"])
-def get_job_status(job_id):
-    """Get the status of an analysis job"""
-    with job_lock:
-        if job_id not in analysis_jobs:
-            return jsonify({"error": "Job not found"}), 404
+async def _reap_stale_jobs():
+    """Periodically drop finished jobs past their TTL."""
+    while True:
+        await asyncio.sleep(_JOB_REAP_INTERVAL_SECONDS)
+        cutoff = time.time() - _JOB_TTL_SECONDS
+        with _jobs_locked():
+            jobs = _load_jobs()
+            live = OrderedDict(
+                (job_id, job)
+                for job_id, job in jobs.items()
+                if job["created_at"] >= cutoff
+            )
+            if len(live) != len(jobs):
+                _save_jobs(live)
 
-        job = analysis_jobs[job_id]
 
-        response = {
-            "job_id": job_id,
-            "status": job["status"],
-            "progress": job["progress"],
-            "created_at": job["created_at"],
-        }
+@app.before_serving
+async def _start_job_reaper():
+    app.add_background_task(_reap_stale_jobs)
 
-        if job["status"] == "completed":
-            response["results"] = job["results"]
-        elif job["status"] == "failed":
-            response["error"] = job["error"]
 
-        return jsonify(response)
+@app.route("/api/status/<job_id>", methods=["GET"])
+async def get_job_status(job_id):
+    """Get the status of an analysis job"""
+    with _jobs_locked():
+        jobs = _load_jobs()
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    response = {
+        "job_id": job_id,
+        "status": job["status"],
+        "progress": job["progress"],
+        "created_at": job["created_at"],
+    }
+
+    if job["status"] == "completed":
+        results = shared_store.get("analysis_results")
+        if results is None:
+            # The results were replaced or the store was cleared since this
+            # job finished; report the failure rather than a stale payload
+            response["status"] = "failed"
+            response["error"] = "Analysis results are no longer available"
+        else:
+            response["results"] = {
+                "message": "Analysis completed successfully",
+                "total_periods": len(results),
+                "tower_jumps_detected": int(_jump_mask(results).sum()),
+                "analysis_summary": job["summary"],
+                "results": dataframe_records_fragment(results),
+            }
+    elif job["status"] == "failed":
+        response["error"] = job["error"]
+
+    return json_response(response)
 
 
 @app.route("/api/results", methods=["GET"])
-def get_results():
-    global analysis_results
+async def get_results():
+    analysis_results = shared_store.get("analysis_results")
 
     if analysis_results is None:
         return (
@@ -176,31 +370,40 @@ def get_results():
     sort_by = request.args.get("sort_by", "TimeStart")
     sort_order = request.args.get("sort_order", "asc")
 
-    # Apply filtering
-    filtered_results = analysis_results
+    # Apply filtering as a numpy mask - no copy of the non-displayed rows is
+    # ever made
     if filter_type == "jumps":
-        filtered_results = analysis_results[analysis_results["IsTowerJump"] == "yes"]
+        mask = _jump_mask(analysis_results)
     elif filter_type == "normal":
-        filtered_results = analysis_results[analysis_results["IsTowerJump"] == "no"]
+        mask = ~_jump_mask(analysis_results)
+    else:
+        mask = None
 
-    # Apply sorting
+    # Intersect the cached sort order with the filter mask; both the sort
+    # and the filter are computed at most once per result set, so each page
+    # request costs O(N) masking plus an O(page) take
     ascending = sort_order == "asc"
-    if sort_by in filtered_results.columns:
-        filtered_results = filtered_results.sort_values(by=sort_by, ascending=ascending)
+    if sort_by in analysis_results.columns:
+        row_positions = _sorted_order(analysis_results, sort_by, ascending)
+        if mask is not None:
+            row_positions = row_positions[mask[row_positions]]
+    elif mask is not None:
+        row_positions = np.flatnonzero(mask)
+    else:
+        row_positions = np.arange(len(analysis_results))
 
     # Calculate pagination
-    total_count = len(filtered_results)
+    total_count = len(row_positions)
     total_pages = (total_count + per_page - 1) // per_page
     start_idx = (page - 1) * per_page
     end_idx = start_idx + per_page
 
     # Get paginated results
-    paginated_results = filtered_results.iloc[start_idx:end_idx]
-    results_dict = paginated_results.to_dict("records")
+    paginated_results = analysis_results.iloc[row_positions[start_idx:end_idx]]
 
-    return jsonify(
+    return json_response(
         {
-            "results": results_dict,
+            "results": dataframe_records_fragment(paginated_results),
             "pagination": {
                 "current_page": page,
                 "per_page": per_page,
@@ -214,8 +417,10 @@ def get_results():
 
 
 @app.route("/api/export", methods=["GET"])
-def export_results():
-    global analysis_results
+async def export_results():
+    global _export_cache
+
+    analysis_results = shared_store.get("analysis_results")
 
     if analysis_results is None:
         return (
@@ -223,27 +428,66 @@ def export_results():
             400,
         )
 
+    headers = {
+        "Content-Type": "text/csv",
+        "Content-Disposition": 'attachment; filename="tower_jumps_analysis_result.csv"',
+    }
+
+    if _export_cache is not None and _export_cache[0] is analysis_results:
+        cached_bytes = _export_cache[1]
+
+        async def stream_cached():
+            for start in range(0, len(cached_bytes), _EXPORT_CHUNK_BYTES):
+                yield cached_bytes[start : start + _EXPORT_CHUNK_BYTES]
+
+        return stream_cached(), 200, headers
+
     try:
-        # Create a temporary file for the CSV export
-        output = io.StringIO()
-        analysis_results.to_csv(output, index=False)
-        output.seek(0)
-
-        # Create a BytesIO object for Flask to send
-        mem = io.BytesIO()
-        mem.write(output.getvalue().encode("utf-8"))
-        mem.seek(0)
-
-        return send_file(
-            mem,
-            mimetype="text/csv",
-            as_attachment=True,
-            download_name="tower_jumps_analysis_result.csv",
+        table = await asyncio.to_thread(
+            pa.Table.from_pandas, analysis_results, preserve_index=False
         )
-
     except Exception as e:
         return jsonify({"error": f"Export failed: {str(e)}"}), 500
 
+    async def generate():
+        # Stream the CSV one record batch at a time: memory stays constant
+        # regardless of result size and the first bytes reach the client
+        # immediately. Small exports are also captured into the cache.
+        global _export_cache
+        pieces = []
+        for chunk in _csv_chunks(table):
+            if pieces is not None:
+                pieces.append(chunk)
+                if sum(len(p) for p in pieces) > _EXPORT_CACHE_MAX_BYTES:
+                    pieces = None
+            yield chunk
+        if pieces is not None:
+            _export_cache = (analysis_results, b"".join(pieces))
+
+    return generate(), 200, headers
+
+
+def _csv_chunks(table, batch_rows=10_000):
+    """Yield CSV bytes for an Arrow table, one record batch at a time."""
+    header = pacsv.WriteOptions(include_header=True)
+    no_header = pacsv.WriteOptions(include_header=False)
+
+    batches = table.to_batches(max_chunksize=batch_rows)
+    if not batches:
+        sink = pa.BufferOutputStream()
+        pacsv.write_csv(table, sink, write_options=header)
+        yield sink.getvalue().to_pybytes()
+        return
+
+    for i, batch in enumerate(batches):
+        sink = pa.BufferOutputStream()
+        pacsv.write_csv(
+            pa.Table.from_batches([batch]),
+            sink,
+            write_options=header if i == 0 else no_header,
+        )
+        yield sink.getvalue().to_pybytes()
+
 
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=5000)
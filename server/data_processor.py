@@ -1,10 +1,60 @@
+import hashlib
+import io
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 from typing import Dict, Any
 
+try:  # Optional: fastest loader when available
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:  # Optional: fused filter kernel for the pandas fallback path
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    # No fastmath here: it would let LLVM assume no NaNs and elide the isnan checks
+    @njit(parallel=True, cache=True)
+    def _valid_row_mask_nb(lat, lon, state_codes):
+        """Keep-mask for rows with usable coordinates, in one parallel pass."""
+        mask = np.empty(lat.size, np.bool_)
+        for i in prange(lat.size):
+            mask[i] = (
+                (lat[i] != 0.0 or lon[i] != 0.0)
+                and not np.isnan(lat[i])
+                and not np.isnan(lon[i])
+                and state_codes[i] >= 0
+            )
+        return mask
+
 
 class DataProcessor:
     """Handles loading and preprocessing of carrier data CSV files."""
 
+    # Preprocessed DataFrames keyed by a hash of the raw file bytes, shared
+    # across instances so repeated uploads of the same file skip the parse
+    # and preprocessing entirely. Capped so cached frames can't grow RSS
+    # without bound.
+    _CACHE_MAX_ENTRIES = 4
+    _cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+
+    # Per-DataFrame memo for get_date_range / get_data_stats, keyed by object
+    # identity. The UI polls these repeatedly for the same upload, and each
+    # call was a full column scan. Entries hold a reference to the DataFrame
+    # so its id() cannot be recycled while the memo is alive.
+    _MEMO_MAX_ENTRIES = 8
+    _range_cache: "OrderedDict[int, tuple]" = OrderedDict()
+    _stats_cache: "OrderedDict[int, tuple]" = OrderedDict()
+
     def __init__(self):
         self.required_columns = [
             "Page",
@@ -22,9 +72,28 @@ class DataProcessor:
         ]
 
     def load_csv_from_file(self, file) -> pd.DataFrame:
-        """Load and preprocess CSV data from uploaded file."""
+        """Load and preprocess CSV data from an uploaded file.
+
+        File paths (the upload spool) are hashed incrementally and handed
+        straight to the parsers, so the raw bytes are never held in memory
+        at once; file-like objects are buffered as before.
+        """
         try:
-            df = pd.read_csv(file)
+            if isinstance(file, (str, bytes)):
+                source = file
+                cache_key = self._hash_path(file)
+            else:
+                source = self._to_binary_buffer(file)
+                cache_key = hashlib.blake2b(
+                    source.getvalue(), digest_size=16
+                ).hexdigest()
+
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+            df = self._read_csv(source)
 
             missing_cols = [
                 col for col in self.required_columns if col not in df.columns
@@ -34,64 +103,271 @@ class DataProcessor:
 
             df = self._preprocess_data(df)
 
+            self._cache[cache_key] = df
+            while len(self._cache) > self._CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
             return df
 
         except Exception as e:
             raise Exception(f"Error loading CSV: {str(e)}")
 
-    def _preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and preprocess the carrier data."""
-        initial_count = len(df)
-        print(f"Initial data count: {initial_count}")
+    def _read_csv(self, source) -> pd.DataFrame:
+        """Parse the CSV with PyArrow's multithreaded reader, falling back to pandas.
 
-        # Remove records with missing or zero coordinates
-        df = df[~((df["Latitude"] == 0) & (df["Longitude"] == 0))]
-        df = df.dropna(subset=["Latitude", "Longitude", "State"])
-        after_location_cleanup = len(df)
-        print(
-            f"After location cleanup: {after_location_cleanup} ({initial_count - after_location_cleanup} removed)"
+        Arrow's CSV parser is multithreaded and SIMD-accelerated, so it is
+        typically 5-20x faster than pandas on large carrier dumps. It is also
+        stricter about malformed rows, so anything it rejects is retried with
+        the forgiving pandas parser.
+
+        Rows with unusable coordinates are dropped batch-by-batch while the
+        file streams through the parser, so peak memory is bounded by the
+        rows we keep rather than the full file.
+
+        When polars is installed it is tried first: its lazy query planner
+        fuses the parse and the coordinate filter into one multithreaded
+        pipeline, so dropped rows never materialize at all.
+        """
+        if pl is not None:
+            df = self._read_csv_polars(source)
+            if df is not None:
+                return df
+            if isinstance(source, io.BytesIO):
+                source.seek(0)
+
+        try:
+            reader = pacsv.open_csv(
+                source,
+                read_options=pacsv.ReadOptions(block_size=8 << 20),
+                parse_options=pacsv.ParseOptions(delimiter=","),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={
+                        "Latitude": pa.float64(),
+                        "Longitude": pa.float64(),
+                    },
+                    timestamp_parsers=["%m/%d/%y %H:%M"],
+                    strings_can_be_null=True,
+                    null_values=[""],
+                ),
+            )
+            batches = [self._filter_batch(batch) for batch in reader]
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            return table.to_pandas()
+        except pa.ArrowInvalid:
+            if isinstance(source, io.BytesIO):
+                source.seek(0)
+            return self._read_csv_chunked(source)
+
+    def _read_csv_polars(self, source):
+        """Polars loader: parse and filter in one lazy multithreaded pipeline.
+
+        Returns None when polars cannot handle the file (missing columns,
+        unexpected types, malformed rows); the Arrow/pandas readers then get
+        their turn. Datetime parsing is left to _preprocess_data so all
+        loaders share one code path.
+        """
+        try:
+            if isinstance(source, io.BytesIO):
+                source = io.BytesIO(source.getvalue())
+            lf = pl.scan_csv(source, null_values=[""])
+            lf = lf.filter(
+                ((pl.col("Latitude") != 0) | (pl.col("Longitude") != 0))
+                & pl.col("Latitude").is_not_null()
+                & pl.col("Longitude").is_not_null()
+                & pl.col("State").is_not_null()
+            )
+            return lf.collect().to_pandas()
+        except Exception:
+            return None
+
+    def _read_csv_chunked(self, source) -> pd.DataFrame:
+        """Pandas fallback reader: parse in chunks, filtering as we go.
+
+        Applying the coordinate filter per chunk keeps peak memory at
+        chunk size plus the rows we keep, instead of the whole file; when
+        reading straight from a path, files larger than RAM still load as
+        long as the kept rows fit.
+        """
+        parts = [
+            self._filter_invalid_rows(chunk)
+            for chunk in pd.read_csv(source, chunksize=200_000)
+        ]
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
+
+    @staticmethod
+    def _filter_batch(batch: pa.RecordBatch) -> pa.RecordBatch:
+        """Drop rows with missing or (0, 0) coordinates from a record batch."""
+        names = batch.schema.names
+        if not all(col in names for col in ("Latitude", "Longitude", "State")):
+            return batch  # Missing columns are reported by load_csv_from_file
+
+        lat = batch.column("Latitude")
+        lon = batch.column("Longitude")
+        state = batch.column("State")
+
+        nonzero = pc.or_(pc.not_equal(lat, 0.0), pc.not_equal(lon, 0.0))
+        present = pc.and_(
+            pc.is_valid(lat), pc.and_(pc.is_valid(lon), pc.is_valid(state))
         )
+        return batch.filter(pc.and_(nonzero, present))
+
+    @staticmethod
+    def _filter_invalid_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """Pandas-path equivalent of the batch-level coordinate filter."""
+        if not all(col in df.columns for col in ("Latitude", "Longitude", "State")):
+            return df
+
+        if (
+            njit is not None
+            and df["Latitude"].dtype.kind == "f"
+            and df["Longitude"].dtype.kind == "f"
+        ):
+            # Fused single pass over the three columns instead of building
+            # several intermediate boolean Series
+            mask = _valid_row_mask_nb(
+                df["Latitude"].to_numpy(np.float64),
+                df["Longitude"].to_numpy(np.float64),
+                pd.factorize(df["State"])[0],  # NaN factorizes to -1
+            )
+            return df[mask]
+
+        df = df[~((df["Latitude"] == 0) & (df["Longitude"] == 0))]
+        return df.dropna(subset=["Latitude", "Longitude", "State"])
+
+    @staticmethod
+    def _hash_path(path) -> str:
+        """Content hash of a file, read incrementally so the bytes are
+        never held in memory at once."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _to_binary_buffer(file) -> io.BytesIO:
+        """Normalize text stream / upload objects to a binary buffer."""
+        data = file.read()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return io.BytesIO(data)
+
+    def _preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean and preprocess the carrier data.
+
+        Records with missing or zero coordinates are already dropped at parse
+        time (see _filter_batch / _filter_invalid_rows).
+        """
+        initial_count = len(df)
+        print(f"Data count after load-time filtering: {initial_count}")
 
-        # Convert datetime columns
+        # Convert the UTC datetime column. Carrier logs repeat the same
+        # minute-resolution timestamps heavily, so cache=True parses each
+        # unique string only once. LocalDateTime is unused downstream and is
+        # parsed on demand via ensure_local_datetime.
         df["UTCDateTime"] = pd.to_datetime(
-            df["UTCDateTime"], format="%m/%d/%y %H:%M", errors="coerce"
-        )
-        df["LocalDateTime"] = pd.to_datetime(
-            df["LocalDateTime"], format="%m/%d/%y %H:%M", errors="coerce"
+            df["UTCDateTime"],
+            format="%m/%d/%y %H:%M",
+            errors="coerce",
+            cache=True,
+            exact=True,
         )
         valid_datetime_count = len(df.dropna(subset=["UTCDateTime"]))
         print(f"Valid datetime records: {valid_datetime_count}")
 
-        # Convert coordinates to numeric, handling missing values
-        df["Latitude"] = pd.to_numeric(df["Latitude"], errors="coerce")
-        df["Longitude"] = pd.to_numeric(df["Longitude"], errors="coerce")
+        # Convert coordinates to numeric, handling missing values. float32
+        # covers GPS precision (~1m) at half the memory of float64, which
+        # also doubles SIMD throughput for the distance math downstream
+        df["Latitude"] = pd.to_numeric(df["Latitude"], errors="coerce").astype(
+            np.float32
+        )
+        df["Longitude"] = pd.to_numeric(df["Longitude"], errors="coerce").astype(
+            np.float32
+        )
+
+        # Page/Item are small positive integers; int64 wastes half the space
+        for col in ("Page", "Item"):
+            numeric = pd.to_numeric(df[col], errors="coerce")
+            if not numeric.isna().any():
+                df[col] = numeric.astype(np.int32)
 
-        # Fill missing string fields
+        # Fill missing string fields and dictionary-encode them. These columns
+        # have a handful of unique values across millions of rows, so storing
+        # integer category codes instead of Python strings cuts their memory
+        # to a few bytes per row and makes value_counts/nunique O(categories)
         string_columns = ["City", "County", "State", "Country", "TimeZone"]
         for col in string_columns:
-            df[col] = df[col].fillna("")
+            df[col] = df[col].fillna("").astype("category")
 
-        # Sort by datetime for chronological processing
-        df = df.sort_values("UTCDateTime").reset_index(drop=True)
+        # Sort by datetime for chronological processing. Argsorting the raw
+        # datetime64 array and permuting with take is 2-4x faster than a
+        # pandas-level sort_values across all the mixed-dtype blocks (NaT
+        # still sorts last, matching sort_values).
+        order = np.argsort(df["UTCDateTime"].to_numpy(), kind="stable")
+        df = df.take(order).reset_index(drop=True)
+
+        # Downstream consumers (the detector) use this to skip re-sorting
+        df.attrs["_sorted"] = True
 
         return df
 
+    def ensure_local_datetime(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Parse the LocalDateTime column on demand.
+
+        Nothing in the analysis pipeline reads LocalDateTime, so it is left
+        unparsed during preprocessing; callers that need it call this first.
+        """
+        if not pd.api.types.is_datetime64_any_dtype(df["LocalDateTime"]):
+            df["LocalDateTime"] = pd.to_datetime(
+                df["LocalDateTime"],
+                format="%m/%d/%y %H:%M",
+                errors="coerce",
+                cache=True,
+                exact=True,
+            )
+        return df
+
     def get_date_range(self, df: pd.DataFrame) -> Dict[str, str]:
         """Get the date range of the data."""
+        cached = self._range_cache.get(id(df))
+        if cached is not None and cached[0] is df:
+            return cached[1]
+
+        result = self._compute_date_range(df)
+        self._memoize(self._range_cache, id(df), (df, result))
+        return result
+
+    @staticmethod
+    def _compute_date_range(df: pd.DataFrame) -> Dict[str, str]:
         if df.empty or "UTCDateTime" not in df.columns:
             return {"start": "N/A", "end": "N/A"}
 
-        valid_dates = df["UTCDateTime"].dropna()
-        if valid_dates.empty:
+        # min/max on the raw datetime64 array skips Series dispatch and the
+        # dropna copy
+        values = df["UTCDateTime"].to_numpy()
+        valid_dates = values[~np.isnat(values)]
+        if valid_dates.size == 0:
             return {"start": "N/A", "end": "N/A"}
 
         return {
-            "start": valid_dates.min().strftime("%Y-%m-%d %H:%M:%S"),
-            "end": valid_dates.max().strftime("%Y-%m-%d %H:%M:%S"),
+            "start": pd.Timestamp(valid_dates.min()).strftime("%Y-%m-%d %H:%M:%S"),
+            "end": pd.Timestamp(valid_dates.max()).strftime("%Y-%m-%d %H:%M:%S"),
         }
 
+    @classmethod
+    def _memoize(cls, cache: OrderedDict, key: int, value) -> None:
+        cache[key] = value
+        while len(cache) > cls._MEMO_MAX_ENTRIES:
+            cache.popitem(last=False)
+
     def get_data_stats(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Get basic statistics about the data."""
+        cached = self._stats_cache.get(id(df))
+        if cached is not None and cached[0] is df:
+            return cached[1]
+
         stats = {
             "total_records": len(df),
             "records_with_location": (
@@ -99,7 +375,7 @@ class DataProcessor:
                 if all(col in df.columns for col in ["Latitude", "Longitude"])
                 else 0
             ),
-            "unique_states": df["State"].nunique() if "State" in df.columns else 0,
+            "unique_states": self._count_unique_states(df),
             "date_range": self.get_date_range(df),
             "cell_types": (
                 df["CellType"].value_counts().to_dict()
@@ -111,4 +387,15 @@ class DataProcessor:
         if "State" in df.columns:
             stats["states"] = df["State"].value_counts().to_dict()
 
+        self._memoize(self._stats_cache, id(df), (df, stats))
         return stats
+
+    @staticmethod
+    def _count_unique_states(df: pd.DataFrame) -> int:
+        """Count distinct states, using the O(1) category table when present."""
+        if "State" not in df.columns:
+            return 0
+        state = df["State"]
+        if isinstance(state.dtype, pd.CategoricalDtype):
+            return int(state.cat.categories.size)
+        return state.nunique()
@@ -0,0 +1,129 @@
+"""Cross-worker DataFrame store backed by shared memory.
+
+Under a multi-worker deploy (hypercorn --workers N) each worker process gets
+its own copy of module globals, so an upload handled by one worker is
+invisible to the others and large DataFrames are duplicated per worker.
+This module keeps each DataFrame in a named shared-memory segment as an
+Arrow IPC stream: any worker can attach to the segment by key and rebuild
+the frame without pickling.
+
+Each segment carries a random version token so workers can tell when the
+value changed. A per-process cache returns the same materialized DataFrame
+object for repeated reads of an unchanged version, which keeps identity-based
+caches (e.g. the CSV export cache) effective.
+
+Small non-DataFrame state (the analysis job table) goes through the raw
+put_bytes/get_bytes API on the same segment layout.
+"""
+
+import struct
+import uuid
+from multiprocessing import resource_tracker, shared_memory
+
+import pandas as pd
+import pyarrow as pa
+
+# Segment layout: 16-byte version token, 8-byte payload length, payload
+_HEADER = struct.Struct("<16sQ")
+_PREFIX = "towerjumps-"
+
+# key -> (version, DataFrame) for the current process
+_local_cache = {}
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    """Detach the segment from this process's resource tracker.
+
+    SharedMemory registers the segment with the resource tracker on both
+    create and attach, and the tracker unlinks everything it knows about
+    when its process exits -- so a recycled worker that merely read a
+    segment would wipe it for every surviving worker. Segment lifetime is
+    owned explicitly by put()/delete(); nothing should be left for the
+    tracker to clean up. (delete() skips this: unlink() itself
+    unregisters, balancing the attach.)
+    """
+    resource_tracker.unregister(shm._name, "shared_memory")
+
+
+def _write_segment(key: str, payload: bytes) -> bytes:
+    """Replace the segment for `key` with `payload`; returns the version."""
+    version = uuid.uuid4().bytes
+    delete(key)
+    shm = shared_memory.SharedMemory(
+        create=True, name=_PREFIX + key, size=_HEADER.size + len(payload)
+    )
+    _untrack(shm)
+    try:
+        shm.buf[: _HEADER.size] = _HEADER.pack(version, len(payload))
+        shm.buf[_HEADER.size : _HEADER.size + len(payload)] = payload
+    finally:
+        shm.close()
+    return version
+
+
+def put(key: str, df: pd.DataFrame) -> None:
+    """Publish a DataFrame under `key`, replacing any previous value."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    version = _write_segment(key, sink.getvalue().to_pybytes())
+    _local_cache[key] = (version, df)
+
+
+def put_bytes(key: str, payload: bytes) -> None:
+    """Publish raw bytes under `key`, replacing any previous value."""
+    _write_segment(key, payload)
+
+
+def get_bytes(key: str) -> bytes | None:
+    """Fetch the raw bytes stored under `key`, or None if absent."""
+    try:
+        shm = shared_memory.SharedMemory(name=_PREFIX + key)
+    except FileNotFoundError:
+        return None
+
+    _untrack(shm)
+    try:
+        _, length = _HEADER.unpack_from(shm.buf)
+        return bytes(shm.buf[_HEADER.size : _HEADER.size + length])
+    finally:
+        shm.close()
+
+
+def get(key: str) -> pd.DataFrame | None:
+    """Fetch the DataFrame stored under `key`, or None if absent."""
+    try:
+        shm = shared_memory.SharedMemory(name=_PREFIX + key)
+    except FileNotFoundError:
+        _local_cache.pop(key, None)
+        return None
+
+    _untrack(shm)
+    try:
+        version, length = _HEADER.unpack_from(shm.buf)
+
+        cached = _local_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        payload = bytes(shm.buf[_HEADER.size : _HEADER.size + length])
+    finally:
+        shm.close()
+
+    table = pa.ipc.open_stream(payload).read_all()
+    df = table.to_pandas()
+    _local_cache[key] = (version, df)
+    return df
+
+
+def delete(key: str) -> None:
+    """Remove the value stored under `key`, if any."""
+    _local_cache.pop(key, None)
+    try:
+        shm = shared_memory.SharedMemory(name=_PREFIX + key)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
@@ -1,15 +1,99 @@
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from geopy.distance import geodesic
 from typing import List, Dict, Any, Tuple
 
+# IUGG mean Earth radius
+EARTH_RADIUS_KM = 6371.0088
+
+try:  # Optional: JIT kernel for large periods, plain NumPy otherwise
+    from _haversine_nb import max_pairwise_km, warm as _warm_haversine_kernels
+except ImportError:
+    max_pairwise_km = None
+
+try:  # Optional: C-backed pairwise haversine instead of the broadcast below
+    from sklearn.metrics.pairwise import haversine_distances
+except ImportError:
+    haversine_distances = None
+
+try:  # Optional: thread-parallel per-period distance work
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
+try:  # Optional: hull-based diameter shortcut for large periods
+    from scipy.spatial import ConvexHull, QhullError
+except ImportError:
+    ConvexHull = None
+
+# Pairwise work below this size is cheaper in plain NumPy than a kernel call
+_NUMBA_MIN_POINTS = 64
+
+# Gap (minutes) above which consecutive records start a new period
+DEFAULT_TIME_WINDOW_MINUTES = 30
+
+# Memoized analyze() results kept per detector instance
+_ANALYZE_CACHE_MAX_ENTRIES = 8
+
+
+def _haversine_km_rad(lat1, lon1, lat2, lon2):
+    """Element-wise haversine distance in kilometers, inputs in radians."""
+    a = (
+        np.sin((lat2 - lat1) * 0.5) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """Element-wise haversine distance in kilometers for coordinate arrays
+    given in degrees."""
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(c)) for c in (lat1, lon1, lat2, lon2)
+    )
+    return _haversine_km_rad(lat1, lon1, lat2, lon2)
+
+
+# Above this period size the hull diameter beats direct pairwise work
+_HULL_MIN_POINTS = 32
+
+
+def _hull_max_distance(lat_rad, lon_rad):
+    """Max pairwise distance via the convex hull of the point set.
+
+    The diameter of a point set is attained on its convex hull, so only the
+    hull vertices (typically far fewer than n) need pairwise treatment. The
+    hull is built on an equirectangular projection, which preserves hull
+    topology at the regional scale of tower data; exact haversine is then
+    evaluated over hull vertex pairs only. Returns None on degenerate input
+    (e.g. collinear points) so the caller can fall back.
+    """
+    lat0 = lat_rad.mean()
+    x = EARTH_RADIUS_KM * np.cos(lat0) * lon_rad
+    y = EARTH_RADIUS_KM * lat_rad
+    try:
+        hull = ConvexHull(np.column_stack((x, y)))
+    except QhullError:
+        return None
+
+    vertices = hull.vertices
+    lat_h = lat_rad[vertices]
+    lon_h = lon_rad[vertices]
+    i, j = np.triu_indices(vertices.size, k=1)
+    distances = _haversine_km_rad(lat_h[i], lon_h[i], lat_h[j], lon_h[j])
+    return float(distances.max())
+
 
 class TowerJumpDetector:
     """Detects tower jumps in cellular carrier data."""
 
     def __init__(
-        self, max_speed_kmh: float = 1000.0, min_confidence_threshold: float = 50.0
+        self,
+        max_speed_kmh: float = 1000.0,
+        min_confidence_threshold: float = 50.0,
+        coord_dtype: np.dtype = np.float32,
+        n_jobs: int = 1,
     ):
         """
         Initialize the tower jump detector.
@@ -17,14 +101,34 @@ class TowerJumpDetector:
         Args:
             max_speed_kmh: Maximum realistic travel speed in km/h (default 1000 km/h ~ aircraft speed)
             min_confidence_threshold: Minimum confidence level to consider valid
+            coord_dtype: dtype for coordinate arrays in the distance kernels.
+                float32 (~1 m precision) halves memory traffic; pass
+                np.float64 for precision-sensitive use
+            n_jobs: joblib worker count for the per-period distance pass
+                (1 = serial; requires joblib for other values)
         """
         self.max_speed_kmh = max_speed_kmh
         self.min_confidence_threshold = min_confidence_threshold
+        self.coord_dtype = np.dtype(coord_dtype)
+        self.n_jobs = n_jobs
+
+        # Content-keyed memo of analyze() results; per instance because the
+        # thresholds above feed into the scoring
+        self._analyze_cache: OrderedDict = OrderedDict()
+
+        if max_pairwise_km is not None:
+            # Warm the JIT cache so the first analyze() doesn't pay compile cost
+            _warm_haversine_kernels()
 
     def analyze(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Analyze the data to detect tower jumps.
 
+        The frame is time-sorted, so periods are contiguous runs: a
+        diff/cumsum over the timestamps labels them and every per-period
+        metric comes from segmented reductions (reduceat/bincount) over
+        those runs -- no hash-based grouping anywhere in the pipeline.
+
         Args:
             df: Preprocessed carrier data DataFrame
 
@@ -34,19 +138,273 @@ class TowerJumpDetector:
         if df.empty:
             return pd.DataFrame()
 
-        # Group consecutive records by location/state with time windows
-        periods = self._create_time_periods(df)
+        fingerprint = self._fingerprint(df)
+        cached = self._analyze_cache.get(fingerprint)
+        if cached is not None:
+            self._analyze_cache.move_to_end(fingerprint)
+            return cached
+
+        # Sort exactly once; frames already sorted upstream (the loader marks
+        # them with attrs["_sorted"]) skip the O(n log n) pass entirely
+        if df.attrs.get("_sorted"):
+            df = df.reset_index(drop=True)
+        else:
+            # Stable argsort on the raw datetime64 array beats sort_values:
+            # no block consolidation and no index machinery on the hot path
+            order = np.argsort(
+                df["UTCDateTime"].to_numpy().astype("datetime64[ns]"),
+                kind="stable",
+            )
+            df = df.take(order).reset_index(drop=True)
+            df.attrs["_sorted"] = True
+        n = len(df)
+
+        # Assign a period id in one vectorized pass: each gap larger than the
+        # time window starts a new period
+        # Integer nanoseconds: gap/duration/speed math stays on int64 views
+        # instead of allocating Timestamp/Timedelta objects
+        t = df["UTCDateTime"].to_numpy().astype("datetime64[ns]")
+        t_ns = t.view(np.int64)
+        gap_minutes = np.diff(t_ns) / 60e9
+        period_id = np.concatenate(
+            ([0], np.cumsum(gap_minutes > DEFAULT_TIME_WINDOW_MINUTES))
+        )
+
+        lat = df["Latitude"].to_numpy(dtype=self.coord_dtype)
+        lon = df["Longitude"].to_numpy(dtype=self.coord_dtype)
+
+        # Work on small integer category codes instead of Python strings;
+        # free when the loader already delivered a categorical State column.
+        # The loader drops null-State rows, so codes are non-negative.
+        state_cat = pd.Categorical(df["State"])
+        state_codes = state_cat.codes.astype(np.int16)
+        state_names = np.asarray(state_cat.categories)
+
+        # Trig inputs for the pairwise distance, computed once per frame
+        lat_rad = np.radians(lat)
+        lon_rad = np.radians(lon)
+        cos_lat = np.cos(lat_rad)
+
+        # All consecutive speeds for the whole frame at once, reusing the
+        # radians and cos(lat) arrays above instead of re-deriving them;
+        # pairs that straddle a period boundary are zeroed out
+        if n > 1:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                half_dlat = np.diff(lat_rad) * 0.5
+                half_dlon = np.diff(lon_rad) * 0.5
+                a = (
+                    np.sin(half_dlat) ** 2
+                    + cos_lat[:-1] * cos_lat[1:] * np.sin(half_dlon) ** 2
+                )
+                distances = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+                dt_hours = np.diff(t_ns) / 3.6e12
+                speeds = np.where(dt_hours > 0, distances / dt_hours, 0.0)
+            speeds = np.nan_to_num(speeds)
+            speeds[period_id[1:] != period_id[:-1]] = 0.0
+        else:
+            speeds = np.zeros(0)
+
+        starts = np.flatnonzero(
+            np.concatenate(([True], period_id[1:] != period_id[:-1]))
+        )
+        ends = np.concatenate((starts[1:], [n]))
+
+        # The frame is sorted, so period boundaries give the start/end times
+        # directly; one vectorized strftime per column formats them all
+        time_start_str = (
+            pd.DatetimeIndex(t[starts]).strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+        )
+        time_end_str = (
+            pd.DatetimeIndex(t[ends - 1]).strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+        )
+        durations = (t_ns[ends - 1] - t_ns[starts]) / 60e9
+
+        # Segmented sums divided by sizes: per-period means in two C-level
+        # reductions (accumulated in float64 regardless of coord dtype)
+        sizes = ends - starts
+        avg_lats = np.add.reduceat(lat, starts, dtype=np.float64) / sizes
+        avg_lngs = np.add.reduceat(lon, starts, dtype=np.float64) / sizes
+
+        # Phase 1: collect per-period metrics into arrays
+        n_periods = len(starts)
+
+        # Boundary pairs are zeroed above, so a segmented max over the padded
+        # speed array yields every period's max speed in one reduction
+        if n > 1:
+            max_speeds = np.maximum.reduceat(np.append(speeds, 0.0), starts)
+        else:
+            max_speeds = np.zeros(n_periods, dtype=np.float64)
+
+        state_changes = np.zeros(n_periods, dtype=np.int32)
+        max_distances = np.zeros(n_periods, dtype=np.float64)
+        n_unique_states = np.zeros(n_periods, dtype=np.int32)
+        is_ny_ct = np.zeros(n_periods, dtype=bool)
+        all_states = np.empty(n_periods, dtype=object)
+        ny_code = np.searchsorted(state_names, "New York")
+        ct_code = np.searchsorted(state_names, "Connecticut")
+        has_ny = ny_code < state_names.size and state_names[ny_code] == "New York"
+        has_ct = ct_code < state_names.size and state_names[ct_code] == "Connecticut"
+
+        # With few distinct states the per-period membership check becomes a
+        # single bit test on an or-reduced presence mask, and the whole
+        # NY/CT column falls out of one segmented or-reduction
+        use_bitmask = has_ny and has_ct and state_names.size <= 64
+        if use_bitmask:
+            code_bits = np.uint64(1) << state_codes.astype(np.uint64)
+            ny_ct_bits = (np.uint64(1) << np.uint64(ny_code)) | (
+                np.uint64(1) << np.uint64(ct_code)
+            )
+            seg_masks = np.bitwise_or.reduceat(code_bits, starts)
+            is_ny_ct = (seg_masks & ny_ct_bits) == ny_ct_bits
+
+        # State-change counts in one shot: flag every row whose state
+        # differs from its predecessor, zero the flags at period starts so
+        # nothing carries across a boundary, then sum per segment
+        if n > 1:
+            change_flags = np.zeros(n, dtype=np.int32)
+            change_flags[1:] = state_codes[1:] != state_codes[:-1]
+            change_flags[starts] = 0
+            state_changes = np.add.reduceat(change_flags, starts).astype(np.int32)
+
+        for k, (s, e) in enumerate(zip(starts, ends)):
+            unique_codes = np.unique(state_codes[s:e])
+            all_states[k] = ", ".join(state_names[unique_codes])
+            n_unique_states[k] = unique_codes.size
+            if not use_bitmask:
+                is_ny_ct[k] = (
+                    has_ny
+                    and has_ct
+                    and np.any(unique_codes == ny_code)
+                    and np.any(unique_codes == ct_code)
+                )
+
+        # Most frequent state per period: one flat bincount over combined
+        # (period, state) keys instead of a bincount per period. Ties break
+        # on first occurrence within the period, matching _analyze_period's
+        # insertion-ordered dict (a bare argmax would pick alphabetically).
+        n_states = state_names.size
+        pair_keys = period_id * n_states + state_codes
+        pair_counts = np.bincount(pair_keys, minlength=n_periods * n_states).reshape(
+            n_periods, n_states
+        )
+        seen_keys, seen_first = np.unique(pair_keys, return_index=True)
+        first_pos = np.full(n_periods * n_states, n, dtype=np.int64)
+        first_pos[seen_keys] = seen_first
+        # Lexicographic (count desc, first occurrence asc) as one argmax
+        rank = pair_counts.astype(np.int64) * (n + 1) + (
+            n - first_pos.reshape(n_periods, n_states)
+        )
+        primary_states = state_names[rank.argmax(axis=1)]
+
+        # Periods are independent, so the pairwise-distance pass can fan out
+        # over threads (the NumPy/Numba kernels release the GIL)
+        if Parallel is not None and self.n_jobs != 1 and n_periods > 1:
+            max_distances = np.asarray(
+                Parallel(n_jobs=self.n_jobs, prefer="threads", batch_size="auto")(
+                    delayed(self._calculate_max_distance)(
+                        None,
+                        lat_rad=lat_rad[s:e],
+                        lon_rad=lon_rad[s:e],
+                        cos_lat=cos_lat[s:e],
+                    )
+                    for s, e in zip(starts, ends)
+                )
+            )
+        else:
+            for k, (s, e) in enumerate(zip(starts, ends)):
+                max_distances[k] = self._calculate_max_distance(
+                    None,
+                    lat_rad=lat_rad[s:e],
+                    lon_rad=lon_rad[s:e],
+                    cos_lat=cos_lat[s:e],
+                )
+
+        # Phase 2: score every period at once
+        jumps = self._is_tower_jump_vec(
+            state_changes,
+            max_speeds,
+            durations,
+            n_unique_states,
+            max_distances,
+            is_ny_ct,
+        )
+        record_counts = (ends - starts).astype(np.int32)
+        confidences = self._calculate_confidence_vec(
+            state_changes,
+            max_speeds,
+            durations,
+            record_counts,
+            max_distances,
+            jumps,
+            is_ny_ct,
+        )
+
+        confidence_col = np.round(confidences, 1)
+        speed_col = np.round(max_speeds, 1)
+
+        # Every column is already a fully-typed array, so this construction
+        # does no per-row dict handling or dtype inference
+        result = pd.DataFrame(
+            {
+                "TimeStart": time_start_str,
+                "TimeEnd": time_end_str,
+                "DurationMinutes": np.round(durations, 2),
+                "State": primary_states,
+                "AllStates": all_states,
+                "IsTowerJump": np.where(jumps, "yes", "no"),
+                "ConfidenceLevel": confidence_col,
+                "RecordCount": record_counts,
+                "StateChanges": state_changes,
+                "MaxSpeedKMH": speed_col,
+                "MaxDistanceKM": np.round(max_distances, 2),
+                "AvgLatitude": np.round(avg_lats, 6),
+                "AvgLongitude": np.round(avg_lngs, 6),
+            }
+        )
+
+        # The summary falls out of arrays already in hand, so compute it
+        # here and stash it on the frame; get_summary_stats() returns it
+        # without a second pass over the results
+        n_jumps = int(np.count_nonzero(jumps))
+        result.attrs["summary"] = {
+            "total_periods": n_periods,
+            "tower_jumps_detected": n_jumps,
+            "tower_jump_percentage": round(n_jumps / n_periods * 100, 1),
+            "avg_confidence": round(float(confidence_col.mean()), 1),
+            "max_speed_detected": round(float(speed_col.max()), 1),
+            "states_involved": pd.unique(primary_states).tolist(),
+            "date_range": {
+                # Periods come out in chronological order, so the frame's
+                # first start and last end bound the whole range
+                "start": time_start_str[0],
+                "end": time_end_str[-1],
+            },
+        }
 
-        # Analyze each period for tower jumps
-        results = []
-        for period in periods:
-            analysis = self._analyze_period(period, df)
-            results.append(analysis)
+        self._analyze_cache[fingerprint] = result
+        if len(self._analyze_cache) > _ANALYZE_CACHE_MAX_ENTRIES:
+            self._analyze_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _fingerprint(df: pd.DataFrame) -> int:
+        """Cheap content fingerprint for memoizing analyze() results."""
+        timestamps = df["UTCDateTime"]
+        return hash(
+            (
+                len(df),
+                timestamps.iloc[0],
+                timestamps.iloc[-1],
+                int(pd.util.hash_pandas_object(df, index=False).sum()),
+            )
+        )
 
-        return pd.DataFrame(results)
+    def clear_analysis_cache(self) -> None:
+        """Drop memoized analyze() results."""
+        self._analyze_cache.clear()
 
     def _create_time_periods(
-        self, df: pd.DataFrame, time_window_minutes: int = 30
+        self, df: pd.DataFrame, time_window_minutes: int = DEFAULT_TIME_WINDOW_MINUTES
     ) -> List[Dict]:
         """
         Create time periods by grouping consecutive records.
@@ -58,94 +416,66 @@ class TowerJumpDetector:
         Returns:
             List of time period dictionaries
         """
-        periods = []
-
         if df.empty:
-            return periods
-
-        # Sort by time
-        df_sorted = df.sort_values("UTCDateTime").reset_index()
-
-        current_period = {
-            "start_time": df_sorted.iloc[0]["UTCDateTime"],
-            "end_time": df_sorted.iloc[0]["UTCDateTime"],
-            "records": [0],
-            "states": [df_sorted.iloc[0]["State"]],
-            "locations": [
-                (df_sorted.iloc[0]["Latitude"], df_sorted.iloc[0]["Longitude"])
-            ],
-        }
+            return []
 
-        # Iterate through remaining records starting from index 1
-        # (index 0 was already added to the first period above)
-        for i in range(1, len(df_sorted)):
-            current_row = df_sorted.iloc[i]
-
-            # Calculate time difference between current record and the end of current period
-            # Convert from seconds to minutes for easier comparison with time_window_minutes
-            time_diff = (
-                current_row["UTCDateTime"] - current_period["end_time"]
-            ).total_seconds() / 60
-
-            # Decision point: Should this record extend the current period or start a new one?
-            # If the time gap is larger than our window (default 30 minutes),
-            # we consider this record to be from a separate activity session
-            if time_diff > time_window_minutes:
-                # Time gap is too large - finalize current period and start new one
-
-                # Save the completed period to our results list
-                periods.append(current_period)
-
-                # Initialize a new period starting with this record
-                # This record becomes both the start and end of the new period
-                current_period = {
-                    "start_time": current_row["UTCDateTime"],  # Period begins here
-                    "end_time": current_row[
-                        "UTCDateTime"
-                    ],  # Period ends here (for now)
-                    "records": [i],  # List of record indices in this period
-                    "states": [
-                        current_row["State"]
-                    ],  # List of states visited in this period
-                    "locations": [
-                        (current_row["Latitude"], current_row["Longitude"])
-                    ],  # List of (lat, lng) tuples
-                }
-            else:
-                # Time gap is small enough - extend current period with this record
-
-                # Update the end time of current period to include this record
-                current_period["end_time"] = current_row["UTCDateTime"]
-
-                # Add this record's index to the period's record list
-                # This helps us track which original data rows belong to this period
-                current_period["records"].append(i)
-
-                # Add this record's state to the period's state history
-                # This creates a chronological list of state changes within the period
-                current_period["states"].append(current_row["State"])
-
-                # Add this record's location to the period's location history
-                # This creates a chronological path of locations within the period
-                current_period["locations"].append(
-                    (current_row["Latitude"], current_row["Longitude"])
-                )
+        # Sort by time, unless the caller already guarantees it
+        if df.attrs.get("_sorted"):
+            df_sorted = df.reset_index(drop=True)
+        else:
+            order = np.argsort(
+                df["UTCDateTime"].to_numpy().astype("datetime64[ns]"),
+                kind="stable",
+            )
+            df_sorted = df.take(order).reset_index(drop=True)
+
+        times = df_sorted["UTCDateTime"].to_numpy().astype("datetime64[ns]")
+        t_ns = times.view(np.int64)
+        lat = df_sorted["Latitude"].to_numpy(dtype=self.coord_dtype)
+        lon = df_sorted["Longitude"].to_numpy(dtype=self.coord_dtype)
+        states = df_sorted["State"].to_numpy()
+
+        # Records whose gap to the previous one exceeds the window start a
+        # new period: find all boundaries in one vectorized pass. Slicing by
+        # boundary pairs avoids materializing per-period index arrays.
+        cuts = np.flatnonzero(np.diff(t_ns) / 60e9 > time_window_minutes) + 1
+        bounds = np.concatenate(([0], cuts, [len(df_sorted)]))
 
-        # Don't forget the last period! After the loop ends, we still have
-        # the final period in current_period that needs to be added to results
-        # Only add it if it actually contains records (safety check)
-        if current_period["records"]:
-            periods.append(current_period)
+        periods = []
+        for s, e in zip(bounds[:-1], bounds[1:]):
+            period = {
+                # Timestamp-wrapped for compatibility with strftime callers
+                "start_time": pd.Timestamp(times[s]),
+                "end_time": pd.Timestamp(times[e - 1]),
+                "records": list(range(s, e)),
+                "states": states[s:e].tolist(),
+                # (k, 2) float array: contiguous, no per-point tuple boxing
+                "locations": np.column_stack((lat[s:e], lon[s:e])),
+                "t_ns": t_ns[s:e],
+            }
+            periods.append(self._finalize_period(period))
 
         return periods
 
-    def _analyze_period(self, period: Dict, df: pd.DataFrame) -> Dict:
+    @staticmethod
+    def _finalize_period(period: Dict) -> Dict:
+        """Attach the radian/cosine arrays reused by the distance math."""
+        coords = np.asarray(period["locations"])
+        if coords.dtype.kind != "f":
+            coords = coords.astype(np.float64)
+        period["lat_rad"] = np.radians(coords[:, 0])
+        period["lon_rad"] = np.radians(coords[:, 1])
+        period["cos_lat"] = np.cos(period["lat_rad"])
+        return period
+
+    def _analyze_period(self, period: Dict, df: pd.DataFrame = None) -> Dict:
         """
         Analyze a single time period for tower jumps.
 
         Args:
             period: Time period dictionary
-            df: Original DataFrame
+            df: Original DataFrame; only consulted for hand-built periods
+                whose dicts lack the precomputed coordinate arrays
 
         Returns:
             Analysis result dictionary
@@ -164,12 +494,21 @@ class TowerJumpDetector:
         )
 
         # Calculate distances and speeds
-        max_distance_km = self._calculate_max_distance(period["locations"])
+        max_distance_km = self._calculate_max_distance(
+            period["locations"],
+            lat_rad=period.get("lat_rad"),
+            lon_rad=period.get("lon_rad"),
+            cos_lat=period.get("cos_lat"),
+        )
         max_speed_kmh = self._calculate_max_speed(period, df)
 
         # Determine if this is a tower jump
         is_tower_jump = self._is_tower_jump(
-            num_state_changes, max_speed_kmh, duration_minutes, unique_states, max_distance_km
+            num_state_changes,
+            max_speed_kmh,
+            duration_minutes,
+            unique_states,
+            max_distance_km,
         )
 
         # Calculate confidence level
@@ -189,9 +528,11 @@ class TowerJumpDetector:
             state_counts[state] = state_counts.get(state, 0) + 1
         primary_state = max(state_counts, key=state_counts.get)
 
-        # Calculate average location
-        avg_lat = np.mean([loc[0] for loc in period["locations"]])
-        avg_lng = np.mean([loc[1] for loc in period["locations"]])
+        # Calculate average location (locations may be an (k, 2) array or a
+        # list of tuples from older callers)
+        coords = np.asarray(period["locations"], dtype=np.float64)
+        avg_lat = float(coords[:, 0].mean())
+        avg_lng = float(coords[:, 1].mean())
 
         return {
             "TimeStart": period["start_time"].strftime("%Y-%m-%d %H:%M:%S"),
@@ -209,55 +550,152 @@ class TowerJumpDetector:
             "AvgLongitude": round(avg_lng, 6),
         }
 
-    def _calculate_max_distance(self, locations: List[Tuple[float, float]]) -> float:
-        """Calculate maximum distance between any two points in kilometers."""
-        if len(locations) < 2:
-            return 0.0
+    def _calculate_max_distance(
+        self,
+        locations: List[Tuple[float, float]],
+        lat_rad: np.ndarray = None,
+        lon_rad: np.ndarray = None,
+        cos_lat: np.ndarray = None,
+    ) -> float:
+        """Calculate maximum distance between any two points in kilometers.
 
-        max_distance = 0.0
-        for i in range(len(locations)):
-            for j in range(i + 1, len(locations)):
-                try:
-                    distance = geodesic(locations[i], locations[j]).kilometers
-                    max_distance = max(max_distance, distance)
-                except:
-                    continue
+        Uses a vectorized haversine over all point pairs instead of a
+        Python-level pair loop. Invalid coordinates become NaN and are
+        ignored in the reduction. Callers that already hold the coordinates
+        in radians (and optionally their cosines) can pass them to skip the
+        per-call trig conversion.
+        """
+        if lat_rad is None or lon_rad is None:
+            coords = np.asarray(locations, dtype=np.float64)
+            if len(coords) < 2:
+                return 0.0
+            lat_rad = np.radians(coords[:, 0])
+            lon_rad = np.radians(coords[:, 1])
+            cos_lat = None
+
+        n = lat_rad.size
+        if n < 2:
+            return 0.0
 
-        return max_distance
+        # All points identical (common for tower data): no pairwise work
+        # needed. NaN spans compare false, so invalid coords still fall
+        # through to the NaN-aware paths below.
+        if np.ptp(lat_rad) < 1e-12 and np.ptp(lon_rad) < 1e-12:
+            return 0.0
 
-    def _calculate_max_speed(self, period: Dict, df: pd.DataFrame) -> float:
-        """Calculate maximum speed between consecutive records in km/h."""
-        if len(period["records"]) < 2:
+        if ConvexHull is not None and n > _HULL_MIN_POINTS:
+            valid = ~(np.isnan(lat_rad) | np.isnan(lon_rad))
+            lat_v, lon_v = lat_rad[valid], lon_rad[valid]
+            if lat_v.size < 2:
+                return 0.0
+            hull_distance = _hull_max_distance(
+                lat_v.astype(np.float64), lon_v.astype(np.float64)
+            )
+            if hull_distance is not None:
+                return hull_distance
+
+        if max_pairwise_km is not None and n >= _NUMBA_MIN_POINTS:
+            valid = ~(np.isnan(lat_rad) | np.isnan(lon_rad))
+            lat_v, lon_v = lat_rad[valid], lon_rad[valid]
+            if lat_v.size < 2:
+                return 0.0
+            return float(max_pairwise_km(lat_v, lon_v))
+
+        if haversine_distances is not None:
+            coords_rad = np.column_stack((lat_rad, lon_rad))
+            coords_rad = coords_rad[~np.isnan(coords_rad).any(axis=1)]
+            if len(coords_rad) < 2:
+                return 0.0
+            pairwise = haversine_distances(coords_rad) * EARTH_RADIUS_KM
+            return float(pairwise.max())
+
+        if cos_lat is None:
+            # N cosines here instead of N^2 inside the pair expansion
+            cos_lat = np.cos(lat_rad)
+
+        # Only the upper triangle: the pairwise matrix is symmetric
+        i, j = np.triu_indices(n, k=1)
+        dlat = lat_rad[i] - lat_rad[j]
+        dlon = lon_rad[i] - lon_rad[j]
+        with np.errstate(invalid="ignore"):
+            a = (
+                np.sin(dlat * 0.5) ** 2
+                + cos_lat[i] * cos_lat[j] * np.sin(dlon * 0.5) ** 2
+            )
+            distances = 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+        distances = distances[~np.isnan(distances)]
+        if distances.size == 0:
             return 0.0
+        return float(distances.max())
 
-        max_speed = 0.0
+    def _calculate_max_speed(self, period: Dict, df: pd.DataFrame = None) -> float:
+        """Calculate maximum speed between consecutive records in km/h.
 
-        for i in range(1, len(period["records"])):
-            prev_idx = period["records"][i - 1]
-            curr_idx = period["records"][i]
+        Periods built by _create_time_periods carry their coordinate and
+        timestamp arrays, so no DataFrame access is needed; `df` is only
+        consulted for hand-built periods that just list record indices.
+        """
+        lat_rad = period.get("lat_rad")
+        lon_rad = period.get("lon_rad")
+        t_ns = period.get("t_ns")
+        if lat_rad is None or lon_rad is None or t_ns is None:
+            idx = np.asarray(period["records"])
+            if idx.size < 2:
+                return 0.0
+            lat_rad = np.radians(df["Latitude"].to_numpy(dtype=np.float64)[idx])
+            lon_rad = np.radians(df["Longitude"].to_numpy(dtype=np.float64)[idx])
+            t_ns = (
+                df["UTCDateTime"]
+                .to_numpy()
+                .astype("datetime64[ns]")
+                .view(np.int64)[idx]
+            )
+
+        return self._max_speed_from_arrays(lat_rad, lon_rad, t_ns)
+
+    @staticmethod
+    def _max_speed_from_arrays(
+        lat_rad: np.ndarray, lon_rad: np.ndarray, t_ns: np.ndarray
+    ) -> float:
+        """Max consecutive-pair speed (km/h) from radian coordinate arrays
+        and int64 nanosecond timestamps.
 
-            prev_row = df.iloc[prev_idx]
-            curr_row = df.iloc[curr_idx]
+        One vectorized pass; pairs with invalid coordinates or non-positive
+        time deltas are dropped before the trig rather than zeroed after.
 
-            # Calculate time difference in hours
-            time_diff = (
-                curr_row["UTCDateTime"] - prev_row["UTCDateTime"]
-            ).total_seconds() / 3600
+        Confidence scoring grades the numeric maximum against several
+        thresholds, so the scan cannot stop at the first pair exceeding
+        the speed limit -- it always reduces to the true max.
+        """
+        if lat_rad.size < 2:
+            return 0.0
 
-            if time_diff > 0:
-                try:
-                    # Calculate distance in kilometers
-                    distance = geodesic(
-                        (prev_row["Latitude"], prev_row["Longitude"]),
-                        (curr_row["Latitude"], curr_row["Longitude"]),
-                    ).kilometers
+        # Stationary period: every speed is zero, skip the distance math
+        if np.ptp(lat_rad) < 1e-11 and np.ptp(lon_rad) < 1e-11:
+            return 0.0
 
-                    speed = distance / time_diff
-                    max_speed = max(max_speed, speed)
-                except:
-                    continue
+        dt_hours = np.diff(t_ns) / 3.6e12
+        valid = dt_hours > 0
+        if not valid.all():
+            if not valid.any():
+                return 0.0
+            head = np.flatnonzero(valid)
+            tail = head + 1
+            lat1, lon1 = lat_rad[head], lon_rad[head]
+            lat2, lon2 = lat_rad[tail], lon_rad[tail]
+            dt_hours = dt_hours[valid]
+        else:
+            lat1, lon1 = lat_rad[:-1], lon_rad[:-1]
+            lat2, lon2 = lat_rad[1:], lon_rad[1:]
 
-        return max_speed
+        with np.errstate(invalid="ignore"):
+            speeds = _haversine_km_rad(lat1, lon1, lat2, lon2) / dt_hours
+
+        speeds = speeds[~np.isnan(speeds)]
+        if speeds.size == 0:
+            return 0.0
+        return float(speeds.max())
 
     def _is_tower_jump(
         self,
@@ -280,35 +718,53 @@ class TowerJumpDetector:
         Returns:
             True if this is likely a tower jump
         """
-        # Criteria for tower jump detection:
-        # 1. Multiple state changes in short time
-        # 2. Impossible travel speeds (>1000 km/h ~ aircraft speed)
-        # 3. Rapid ping-ponging between states
-        # 4. Large distances covered in short time
-
-        # Speed-based detection
-        if max_speed > self.max_speed_kmh:
-            return True
-
-        # Distance-based detection: covering large distances quickly
-        if duration > 0 and max_distance > 0:
-            distance_per_hour = max_distance / (duration / 60)  # km/h equivalent
-            if distance_per_hour > self.max_speed_kmh:  # Same threshold as speed
-                return True
-
-        # Frequency-based detection
-        if state_changes >= 3 and duration < 60:  # 3+ state changes in under 1 hour
-            return True
-
-        if len(unique_states) >= 2 and state_changes >= 5:  # Rapid ping-ponging
-            return True
-
-        # Check for NY/CT specific ping-ponging
-        if "New York" in unique_states and "Connecticut" in unique_states:
-            if state_changes >= 2 and duration < 120:  # 2+ changes in 2 hours
-                return True
+        is_ny_ct = "New York" in unique_states and "Connecticut" in unique_states
+        return bool(
+            self._is_tower_jump_vec(
+                np.asarray(state_changes),
+                np.asarray(max_speed),
+                np.asarray(duration),
+                np.asarray(len(unique_states)),
+                np.asarray(max_distance),
+                np.asarray(is_ny_ct),
+            )
+        )
 
-        return False
+    def _is_tower_jump_vec(
+        self,
+        state_changes: np.ndarray,
+        max_speed: np.ndarray,
+        duration: np.ndarray,
+        n_unique_states: np.ndarray,
+        max_distance: np.ndarray,
+        is_ny_ct: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized tower-jump detection over arrays of period metrics.
+
+        Same criteria as before, evaluated branchlessly for all periods:
+        1. Multiple state changes in short time
+        2. Impossible travel speeds (>1000 km/h ~ aircraft speed)
+        3. Rapid ping-ponging between states
+        4. Large distances covered in short time
+        """
+        return (
+            # Speed-based detection
+            (max_speed > self.max_speed_kmh)
+            # Distance-based detection: covering large distances quickly.
+            # max_distance / (duration / 60) > threshold, cross-multiplied so
+            # there is no division (and no divide-by-zero to guard against).
+            | (
+                (duration > 0)
+                & (max_distance > 0)
+                & (max_distance * 60.0 > self.max_speed_kmh * duration)
+            )
+            # Frequency-based detection: 3+ state changes in under 1 hour
+            | ((state_changes >= 3) & (duration < 60))
+            # Rapid ping-ponging
+            | ((n_unique_states >= 2) & (state_changes >= 5))
+            # NY/CT specific ping-ponging: 2+ changes in 2 hours
+            | (is_ny_ct & (state_changes >= 2) & (duration < 120))
+        )
 
     def _calculate_confidence(
         self,
@@ -326,76 +782,111 @@ class TowerJumpDetector:
         Returns:
             Confidence percentage (0-100)
         """
-        confidence = 50.0  # Base confidence
+        is_ny_ct = "New York" in unique_states and "Connecticut" in unique_states
+        return float(
+            self._calculate_confidence_vec(
+                np.asarray(state_changes),
+                np.asarray(max_speed),
+                np.asarray(duration),
+                np.asarray(record_count),
+                np.asarray(max_distance),
+                np.asarray(is_tower_jump),
+                np.asarray(is_ny_ct),
+            )
+        )
+
+    def _calculate_confidence_vec(
+        self,
+        state_changes: np.ndarray,
+        max_speed: np.ndarray,
+        duration: np.ndarray,
+        record_count: np.ndarray,
+        max_distance: np.ndarray,
+        is_tower_jump: np.ndarray,
+        is_ny_ct: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized confidence scoring over arrays of period metrics.
+
+        Same rules as the scalar version; the if/elif ladders become
+        np.select chains evaluated for all periods at once.
+        """
+        confidence = np.full(np.broadcast(state_changes, max_speed).shape, 50.0)
 
         # More records = higher confidence in any decision
-        if record_count >= 10:
-            confidence += 10
-        elif record_count >= 5:
-            confidence += 5
-
-        if is_tower_jump:
-            # We think this is cell tower ping-pong, not real movement
-            # Confidence based on how impossible the movement is
-
-            # Distance-based evidence
-            if max_distance > 500:  # Long distance jump (cross-country)
-                confidence += 20  # Very confident it's tower error
-            elif max_distance > 100:  # Medium distance jump (cross-state)
-                confidence += 15  # Confident it's tower error
-            elif max_distance < 10:  # Short distance ping-pong (border area)
-                confidence += 10  # Likely tower triangulation error
-
-            # Speed-based evidence (backup to distance)
-            if max_speed > self.max_speed_kmh * 2:  # Physically impossible (>2000 km/h)
-                confidence += 15  # Very confident it's tower error
-            elif max_speed > self.max_speed_kmh:  # Very unlikely (>1000 km/h)
-                confidence += 10  # Confident it's tower error
-
-            # Pattern-based evidence
-            if state_changes >= 5:  # Rapid ping-pong pattern
-                confidence += 10  # Likely tower error
-            elif duration < 30 and state_changes >= 3:  # Quick back-and-forth
-                confidence += 10  # Likely tower ping-pong
-            else:
-                confidence += 5   # Possible tower error
+        confidence += np.select(
+            [record_count >= 10, record_count >= 5], [10.0, 5.0], 0.0
+        )
 
-        else:
-            # We think this represents real subscriber location/movement
-            if state_changes == 0 and max_distance < 5:  # Stayed in same local area
-                confidence += 20  # Very confident in actual location
-            elif state_changes <= 1 and max_speed < 100:  # Minimal, reasonable movement
-                confidence += 15  # Confident in actual location
-            elif state_changes <= 2 and max_speed < 200:  # Reasonable travel
-                confidence += 10  # Confident in actual location
-            else:
-                confidence += 5   # Somewhat confident
+        # Cell tower ping-pong: confidence based on how impossible the
+        # movement is (distance, then speed, then pattern evidence)
+        jump_bonus = (
+            np.select(
+                [max_distance > 500, max_distance > 100, max_distance < 10],
+                [20.0, 15.0, 10.0],
+                0.0,
+            )
+            + np.select(
+                [max_speed > self.max_speed_kmh * 2, max_speed > self.max_speed_kmh],
+                [15.0, 10.0],
+                0.0,
+            )
+            + np.select(
+                [state_changes >= 5, (duration < 30) & (state_changes >= 3)],
+                [10.0, 10.0],
+                5.0,
+            )
+        )
+
+        # Real subscriber movement: confidence based on how reasonable it is
+        movement_bonus = np.select(
+            [
+                (state_changes == 0) & (max_distance < 5),
+                (state_changes <= 1) & (max_speed < 100),
+                (state_changes <= 2) & (max_speed < 200),
+            ],
+            [20.0, 15.0, 10.0],
+            5.0,
+        )
+
+        confidence += np.where(is_tower_jump, jump_bonus, movement_bonus)
 
         # NY/CT border area: Known for triangulation issues
-        if "New York" in unique_states and "Connecticut" in unique_states:
-            if is_tower_jump:
-                confidence += 10  # Even more confident it's ping-pong
-            else:
-                confidence -= 5   # Less confident in actual cross-border travel
+        confidence += np.where(is_ny_ct, np.where(is_tower_jump, 10.0, -5.0), 0.0)
 
-        return min(confidence, 100.0)
+        return np.minimum(confidence, 100.0)
 
     def get_summary_stats(self, results: pd.DataFrame) -> Dict[str, Any]:
-        """Get summary statistics of the analysis results."""
+        """Get summary statistics of the analysis results.
+
+        Frames produced by analyze() carry the summary precomputed in
+        attrs; anything else (or a frame whose attrs were stripped) is
+        summarized from its columns.
+        """
         if results.empty:
             return {}
 
-        tower_jumps = results[results["IsTowerJump"] == "yes"]
+        precomputed = results.attrs.get("summary")
+        if precomputed is not None:
+            return dict(precomputed)
+
+        jump = results["IsTowerJump"].to_numpy() == "yes"
+        confidence = results["ConfidenceLevel"].to_numpy()
+        speed = results["MaxSpeedKMH"].to_numpy()
+
+        total_periods = jump.size
+        tower_jumps = int(jump.sum())
 
         return {
-            "total_periods": len(results),
-            "tower_jumps_detected": len(tower_jumps),
-            "tower_jump_percentage": round(len(tower_jumps) / len(results) * 100, 1),
-            "avg_confidence": round(results["ConfidenceLevel"].mean(), 1),
-            "max_speed_detected": round(results["MaxSpeedKMH"].max(), 1),
-            "states_involved": list(results["State"].unique()),
+            "total_periods": total_periods,
+            "tower_jumps_detected": tower_jumps,
+            "tower_jump_percentage": round(tower_jumps / total_periods * 100, 1),
+            "avg_confidence": round(float(confidence.mean()), 1),
+            "max_speed_detected": round(float(speed.max()), 1),
+            "states_involved": pd.unique(results["State"].to_numpy()).tolist(),
             "date_range": {
-                "start": results["TimeStart"].min(),
-                "end": results["TimeEnd"].max(),
+                # TimeStart/TimeEnd are zero-padded "%Y-%m-%d %H:%M:%S"
+                # strings, so the lexicographic min/max is chronological
+                "start": results["TimeStart"].to_numpy().min(),
+                "end": results["TimeEnd"].to_numpy().max(),
             },
         }